@@ -0,0 +1,2 @@
+# the subcommands of the haptools command line client
+# each module should only import click at the top, so that it stays quick to load
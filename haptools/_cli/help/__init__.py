@@ -0,0 +1,58 @@
+from __future__ import annotations
+import os
+from functools import lru_cache
+
+import click
+
+
+# summaries of the subcommands whose help text doesn't start with a suitable one
+_SHORT_HELP = {
+    "transform": "Transform a genotypes matrix via a set of haplotypes",
+}
+
+
+@lru_cache(maxsize=None)
+def load_help(name: str) -> str:
+    """
+    Load the --help text of a subcommand from the .txt file of the same name
+
+    A line containing only \\b is converted into click's marker for a paragraph that
+    shouldn't be rewrapped
+
+    Parameters
+    ----------
+    name : str
+        The name of the subcommand
+
+    Returns
+    -------
+    str
+        The help text, ready to be passed to click
+    """
+    with open(os.path.join(os.path.dirname(__file__), f"{name}.txt")) as help_file:
+        lines = help_file.read().splitlines()
+    return "\n".join("\b" if line == "\\b" else line for line in lines)
+
+
+def load_short_help(name: str, limit: int = 45) -> str:
+    """
+    Get the summary of a subcommand that is listed in 'haptools --help'
+
+    This is the same summary click would create from the subcommand, but it doesn't
+    require importing the module that defines the subcommand or building its options
+
+    Parameters
+    ----------
+    name : str
+        The name of the subcommand
+    limit : int, optional
+        The maximum length of a summary derived from the help text
+
+    Returns
+    -------
+    str
+        The summary of the subcommand
+    """
+    if name in _SHORT_HELP:
+        return _SHORT_HELP[name]
+    return click.Command(name, help=load_help(name)).get_short_help_str(limit)
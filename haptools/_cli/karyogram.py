@@ -0,0 +1,24 @@
+from __future__ import annotations
+import click
+
+from .help import load_help
+
+
+@click.command(help=load_help("karyogram"))
+@click.option('--bp', help="Path to .bp file with breakpoints", \
+    type=str, required=True)
+@click.option('--sample', help="Sample ID to plot", \
+    type=str, required=True)
+@click.option('--out', help="Name of output file", \
+    type=str, required=True)
+@click.option('--title', help="Optional plot title", \
+    type=str, required=False)
+@click.option('--centromeres', help="Optional file with telomere/centromere cM positions", \
+    type=str, required=False)
+@click.option('--colors', help="Optional color dictionary. Format is e.g. 'YRI:blue,CEU:green'", \
+    type=str, required=False)
+def karyogram(bp, sample, out, title, centromeres, colors):
+    from ..karyogram import PlotKaryogram
+    colors = dict(item.split(":", 1) for item in colors.split(",")) if colors else None
+    PlotKaryogram(bp, sample, out, \
+        centromeres_file=centromeres, title=title, colors=colors)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+
+def configure(verbosity: str = "ERROR"):
+    """
+    Set up the "run" logger shared by the subcommands
+
+    logging is imported here, so that only the subcommands that log pay for it
+
+    Parameters
+    ----------
+    verbosity : str, optional
+        The level of verbosity desired in messages written to stderr
+
+    Returns
+    -------
+    Logger
+        The "run" logger
+    """
+    import logging
+
+    logging.basicConfig(
+        format="[%(levelname)8s] %(message)s (%(filename)s:%(lineno)s)",
+        level=verbosity,
+    )
+    return logging.getLogger("run")
@@ -0,0 +1,75 @@
+from __future__ import annotations
+import click
+
+
+# the levels accepted by the --verbosity option of each subcommand
+VERBOSITY_LEVELS = ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET")
+VERBOSITY_CHOICE = click.Choice(VERBOSITY_LEVELS)
+
+# the --region, --sample, and --samples-file options of the subcommands that load
+# genotypes
+_SAMPLE_OPTIONS = (
+    click.option(
+        "--region",
+        type=str,
+        default=None,
+        show_default="all haplotypes",
+        help=(
+            "The region from which to extract haplotypes; ex: 'chr1:1234-34566' or"
+            " 'chr7'.\nFor this to work, the VCF and .hap file must be indexed and the"
+            " seqname provided must correspond with one in the files"
+        ),
+    ),
+    click.option(
+        "-s",
+        "--sample",
+        "samples",
+        type=str,
+        multiple=True,
+        show_default="all samples",
+        help=(
+            "A list of the samples to subset from the genotypes file (ex: '-s sample1"
+            " -s sample2')"
+        ),
+    ),
+    click.option(
+        "-S",
+        "--samples-file",
+        type=click.File("r"),
+        show_default="all samples",
+        help=(
+            "A single column txt file containing a list of the samples (one per line)"
+            " to subset from the genotypes file"
+        ),
+    ),
+)
+
+
+def sample_options(fn):
+    """
+    Attach the --region, --sample, and --samples-file options to a subcommand
+
+    Parameters
+    ----------
+    fn : Callable
+        The function implementing the subcommand
+
+    Returns
+    -------
+    Callable
+        The same function, with the options attached
+    """
+    for option in reversed(_SAMPLE_OPTIONS):
+        fn = option(fn)
+    return fn
+
+
+# the --verbosity option of the subcommands that log their progress
+verbosity_option = click.option(
+    "-v",
+    "--verbosity",
+    type=VERBOSITY_CHOICE,
+    default="ERROR",
+    show_default="only errors",
+    help="The level of verbosity desired",
+)
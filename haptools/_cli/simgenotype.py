@@ -0,0 +1,50 @@
+from __future__ import annotations
+import click
+
+from .help import load_help
+
+# the chromosomes to simulate if --chroms isn't provided
+_DEFAULT_CHROMS = tuple(str(chrom) for chrom in range(1, 23)) + ("X",)
+
+
+@click.command(help=load_help("simgenotype"))
+@click.option('--model', help="Admixture model in .dat format. See docs for info.", \
+    type=str, required=True)
+@click.option('--mapdir', help="Directory containing files with chr\{1-22,X\} and ending in .map in the file name with genetic map coords.", \
+    required=True, type=click.Path(exists=True, file_okay=False, dir_okay=True, readable=True))
+@click.option('--out', help="Prefix to name output files.", \
+    type=str, required=True)
+@click.option('--chroms', help='Sorted and comma delimited list of chromosomes to simulate. ex: 1,2,3,5,6,21,X', \
+    type=str, default=None, required=False)
+@click.option('--seed', help="Random seed. Set to make simulations reproducible", \
+    type=int, required=False, default=None)
+@click.option('--popsize', help="Number of samples to simulate each generation", \
+    type=int, required=False, default=10000, hidden=True)
+@click.option('--invcf', help="VCF file used as reference for creation of simulated samples respective genotypes.", required=True)
+@click.option('--sample_info', help="File that maps samples from the reference VCF (--invcf) to population codes " \
+              "describing the populations in the header of the model file.", required=True)
+@click.option('--only_breakpoint', help="Flag used to determine whether to only output breakpoints or continue to simulate a vcf file.", \
+    is_flag=True, required=False, hidden=True)
+@click.option('--verbose', help="Output time metrics for each section, breakpoint simulation, vcf creation, and total exection.", \
+     is_flag=True, required=False, hidden=True)
+def simgenotype(invcf, sample_info, model, mapdir, out, popsize, seed, chroms, only_breakpoint, verbose):
+    from ..sim_genotype import simulate_gt, write_breakpoints, output_vcf, validate_params
+    import time
+
+    start = time.perf_counter()
+
+    chroms = chroms.split(',') if chroms is not None else list(_DEFAULT_CHROMS)
+    validate_params(model, mapdir, chroms, popsize, invcf, sample_info, only_breakpoint)
+    samples, breakpoints = simulate_gt(model, mapdir, chroms, popsize, seed)
+    breakpoints = write_breakpoints(samples, breakpoints, out)
+    bp_end = time.perf_counter()
+
+    vcf_start = time.perf_counter()
+    if not only_breakpoint:
+        output_vcf(breakpoints, model, invcf, sample_info, out)
+    end = time.perf_counter()
+
+    if verbose:
+        print(f"Time elapsed for breakpoint simulation: {bp_end - start}")
+        print(f"Time elapse for creating vcf: {end - vcf_start}")
+        print(f"Time elapsed for simgenotype execution: {end - start}")
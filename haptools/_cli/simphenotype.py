@@ -0,0 +1,144 @@
+from __future__ import annotations
+from typing import TextIO
+
+import click
+
+from .help import load_help
+from .options import sample_options, verbosity_option
+
+
+@click.command(help=load_help("simphenotype"))
+@click.argument("genotypes", type=click.Path(exists=True))
+@click.argument("haplotypes", type=click.Path(exists=True))
+@click.option(
+    "-r",
+    "--replications",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of rounds of simulation to perform",
+)
+@click.option(
+    "-h",
+    "--heritability",
+    type=click.FloatRange(min=0, max=1),
+    default=None,
+    show_default=True,
+    help="Trait heritability",
+)
+@click.option(
+    "-p",
+    "--prevalence",
+    type=click.FloatRange(min=0, max=1, min_open=False, max_open=True),
+    show_default="quantitative trait",
+    help="Disease prevalence if simulating a case-control trait"
+)
+@sample_options
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(),
+    default="/dev/stdout",
+    show_default="stdout",
+    help="A TSV file containing simulated phenotypes",
+)
+@verbosity_option
+def simphenotype(
+    genotypes: str,
+    haplotypes: str,
+    replications: int = 1,
+    heritability: float = None,
+    prevalence: float = None,
+    region: str = None,
+    samples: tuple[str] = tuple(),
+    samples_file: TextIO = None,
+    chunk_size: int = None,
+    output: str = "-",
+    verbosity: str = 'ERROR',
+):
+    """
+    Command line interface for :py:func:`~haptools.sim_phenotype.simulate_pt`
+
+    Examples
+    --------
+    >>> haptools simphenotype tests/data/example.vcf.gz tests/data/example.hap.gz > simulated.pheno
+
+    Parameters
+    ----------
+    genotypes : str
+        The path to the genotypes in VCF format
+    haplotypes : str
+        The path to the haplotypes in a .hap file
+    replications : int, optional
+        The number of rounds of simulation to perform
+    heritability : int, optional
+        The heritability of the simulated trait; must be a float between 0 and 1
+
+        If not provided, it will be computed from the sum of the squared effect sizes.
+    prevalence : int, optional
+        The prevalence of the disease if the trait should be simulated as case/control;
+        must be a float between 0 and 1
+
+        If not provided, a quantitative trait will be simulated, instead
+    region : str, optional
+        The region from which to extract haplotypes; ex: 'chr1:1234-34566' or 'chr7'
+
+        For this to work, the VCF and .hap file must be indexed and the seqname must
+        match!
+
+        Defaults to loading all haplotypes
+    sample : tuple[str], optional
+        A subset of the samples from which to extract genotypes
+
+        Defaults to loading genotypes from all samples
+    samples_file : TextIO, optional
+        A single column txt file containing a list of the samples (one per line) to
+        subset from the genotypes file
+    chunk_size: int, optional
+        The max number of variants to fetch from the PGEN file at any given time
+
+        If this value is provided, variants from the PGEN file will be loaded in
+        chunks so as to use less memory. This argument is ignored if the genotypes are
+        not in PGEN format.
+    output : str, optional
+        The location to which to write the simulated phenotypes
+    verbosity : str, optional
+        The level of verbosity desired in messages written to stderr
+    """
+    from pathlib import Path
+
+    from .logging_setup import configure
+    from ..sim_phenotype import SimPhenoArgs, simulate_pt
+
+    genotypes, haplotypes, output = Path(genotypes), Path(haplotypes), Path(output)
+
+    log = configure(verbosity)
+    # handle samples
+    if samples and samples_file:
+        raise click.UsageError(
+            "You may only use one of --sample or --samples-file but not both."
+        )
+    if samples_file:
+        with samples_file as samps_file:
+            samples = [line.rstrip("\n") for line in samps_file]
+    elif samples:
+        # needs to be converted from tuple to list
+        samples = list(samples)
+    else:
+        samples = None
+
+    # Run simulation
+    simulate_pt(
+        SimPhenoArgs(
+            genotypes=genotypes,
+            haplotypes=haplotypes,
+            num_replications=replications,
+            heritability=heritability,
+            prevalence=prevalence,
+            region=region,
+            samples=samples,
+            chunk_size=chunk_size,
+            output=output,
+        ),
+        log=log,
+    )
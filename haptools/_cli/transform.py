@@ -0,0 +1,149 @@
+from __future__ import annotations
+from typing import TextIO
+
+import click
+
+from .help import load_help, load_short_help
+from .options import sample_options, verbosity_option
+
+
+@click.command(
+    help=load_help("transform"),
+    short_help=load_short_help("transform"),
+)
+@click.argument("genotypes", type=click.Path(exists=True))
+@click.argument("haplotypes", type=click.Path(exists=True))
+@sample_options
+@click.option(
+    "-h",
+    "--haplotype-ids",
+    type=str,
+    multiple=True,
+    show_default="all haplotypes",
+    help=(
+        "A list of the haplotype IDs to use from the .hap file (ex: '-h H1 -h H2')."
+        "\nFor this to work, the .hap file must be indexed"
+    ),
+)
+@click.option(
+    "-c",
+    "--chunk-size",
+    type=int,
+    default=None,
+    show_default="all variants",
+    help="If using a PGEN file, read genotypes in chunks of X variants; reduces memory",
+)
+@click.option(
+    "--discard-missing",
+    is_flag=True,
+    show_default=True,
+    default=False,
+    help="Ignore any samples that are missing genotypes for the required variants",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(),
+    default="-",
+    show_default="stdout",
+    help="A VCF file containing haplotype 'genotypes'",
+)
+@verbosity_option
+def transform(
+    genotypes: str,
+    haplotypes: str,
+    region: str = None,
+    samples: tuple[str] = tuple(),
+    samples_file: TextIO = None,
+    haplotype_ids: tuple[str] = tuple(),
+    chunk_size: int = None,
+    discard_missing: bool = False,
+    output: str = "-",
+    verbosity: str = 'CRITICAL',
+):
+    """
+    Command line interface for :py:func:`~haptools.transform.transform_haps`
+
+    Examples
+    --------
+    >>> haptools transform tests/data/example.vcf.gz tests/data/example.hap.gz > example_haps.vcf
+
+    Parameters
+    ----------
+    genotypes : str
+        The path to the genotypes
+    haplotypes : str
+        The path to the haplotypes in a .hap file
+    region : str, optional
+        The region from which to extract haplotypes; ex: 'chr1:1234-34566' or 'chr7'
+
+        For this to work, the VCF and .hap file must be indexed and the seqname must
+        match!
+
+        Defaults to loading all haplotypes
+    sample : tuple[str], optional
+        A subset of the samples from which to extract genotypes
+
+        Defaults to loading genotypes from all samples
+    samples_file : TextIO, optional
+        A single column txt file containing a list of the samples (one per line) to
+        subset from the genotypes file
+    haplotype_ids: tuple[str], optional
+        A list of haplotype IDs to obtain from the .hap file. All others are ignored.
+
+        If not provided, all haplotypes will be used.
+    chunk_size: int, optional
+        The max number of variants to fetch from the PGEN file at any given time
+
+        If this value is provided, variants from the PGEN file will be loaded in
+        chunks so as to use less memory. This argument is ignored if the genotypes are
+        not in PGEN format.
+    discard_missing : bool, optional
+        Discard any samples that are missing any of the required samples
+
+        The default is simply to complain about it
+    output : str, optional
+        The location to which to write output
+    verbosity : str, optional
+        The level of verbosity desired in messages written to stderr
+    """
+    from pathlib import Path
+
+    from .logging_setup import configure
+    from ..transform import TransformArgs, transform_haps
+
+    genotypes, haplotypes, output = Path(genotypes), Path(haplotypes), Path(output)
+
+    log = configure(verbosity)
+    # handle samples
+    if samples and samples_file:
+        raise click.UsageError(
+            "You may only use one of --sample or --samples-file but not both."
+        )
+    if samples_file:
+        with samples_file as samps_file:
+            samples = [line.rstrip("\n") for line in samps_file]
+    elif samples:
+        # needs to be converted from tuple to list
+        samples = list(samples)
+    else:
+        samples = None
+
+    if haplotype_ids:
+        haplotype_ids = frozenset(haplotype_ids)
+    else:
+        haplotype_ids = None
+
+    transform_haps(
+        TransformArgs(
+            genotypes=genotypes,
+            haplotypes=haplotypes,
+            region=region,
+            samples=samples,
+            haplotype_ids=haplotype_ids,
+            chunk_size=chunk_size,
+            discard_missing=discard_missing,
+            output=output,
+        ),
+        log=log,
+    )
@@ -0,0 +1,2 @@
+# this must match the version in pyproject.toml
+__version__ = "0.0.1"
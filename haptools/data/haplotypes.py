@@ -613,6 +613,9 @@ class Haplotypes(Data):
         # handle it using tabix
         # else, we use a regular text opener
         if region or haplotypes:
+            # copy the haplotype IDs, since we discard each one as soon as we find it
+            if haplotypes is not None:
+                haplotypes = set(haplotypes)
             haps_file = TabixFile(str(self.fname))
             self.check_header(list(haps_file.header))
             if region:
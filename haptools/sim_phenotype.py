@@ -1,7 +1,7 @@
 from __future__ import annotations
 from pathlib import Path
 from itertools import combinations
-from logging import getLogger, Logger, DEBUG
+from logging import getLogger, basicConfig, Logger, DEBUG
 from dataclasses import dataclass, field
 
 import numpy as np
@@ -186,43 +186,24 @@ class PhenoSimulator:
         self.phens.write()
 
 
-def simulate_pt(
-    genotypes: Path,
-    haplotypes: Path,
-    num_replications: int = 1,
-    heritability: float = None,
-    prevalence: float = None,
-    region: str = None,
-    samples: list[str] = None,
-    chunk_size: int = None,
-    output: Path = Path("-"),
-    log: Logger = None,
-):
+@dataclass(frozen=True)
+class SimPhenoArgs:
     """
-    Haplotype-aware phenotype simulation. Create a set of simulated phenotypes from a
-    set of haplotypes.
-
-    GENOTYPES must be formatted as a VCF or PGEN file and HAPLOTYPES must be formatted
-    according to the .hap format spec
+    The parameters of a run of :py:func:`~.simulate_pt`
 
-    \f
-    Examples
-    --------
-    >>> haptools simphenotype tests/data/example.vcf.gz tests/data/example.hap.gz > simu_phens.tsv
-
-    Parameters
+    Attributes
     ----------
     genotypes : Path
         The path to the genotypes in VCF or PGEN format
     haplotypes : Path
         The path to the haplotypes in a .hap file
-    replications : int, optional
+    num_replications : int, optional
         The number of rounds of simulation to perform
-    heritability : int, optional
+    heritability : float, optional
         The heritability of the simulated trait; must be a float between 0 and 1
 
         If not provided, it will be computed from the sum of the squared effect sizes
-    prevalence : int, optional
+    prevalence : float, optional
         The prevalence of the disease if the trait should be simulated as case/control;
         must be a float between 0 and 1
 
@@ -234,14 +215,11 @@ def simulate_pt(
         match!
 
         Defaults to loading all haplotypes
-    sample : tuple[str], optional
+    samples : list[str], optional
         A subset of the samples from which to extract genotypes
 
         Defaults to loading genotypes from all samples
-    samples_file : Path, optional
-        A single column txt file containing a list of the samples (one per line) to
-        subset from the genotypes file
-    chunk_size: int, optional
+    chunk_size : int, optional
         The max number of variants to fetch from the PGEN file at any given time
 
         If this value is provided, variants from the PGEN file will be loaded in
@@ -249,31 +227,61 @@ def simulate_pt(
         not in PGEN format.
     output : Path, optional
         The location to which to write the simulated phenotypes
+    """
+
+    genotypes: Path
+    haplotypes: Path
+    num_replications: int = 1
+    heritability: float = None
+    prevalence: float = None
+    region: str = None
+    samples: list[str] = None
+    chunk_size: int = None
+    output: Path = Path("-")
+
+
+def simulate_pt(args: SimPhenoArgs, log: Logger = None):
+    """
+    Haplotype-aware phenotype simulation. Create a set of simulated phenotypes from a
+    set of haplotypes.
+
+    GENOTYPES must be formatted as a VCF or PGEN file and HAPLOTYPES must be formatted
+    according to the .hap format spec
+
+    \f
+    Examples
+    --------
+    >>> haptools simphenotype tests/data/example.vcf.gz tests/data/example.hap.gz > simu_phens.tsv
+
+    Parameters
+    ----------
+    args : SimPhenoArgs
+        The genotypes, haplotypes, and other parameters of the simulation
     log : Logger, optional
         The logging module for this task
     """
     if log is None:
-        log = logging.getLogger("run")
-        logging.basicConfig(
+        log = getLogger("run")
+        basicConfig(
             format="[%(levelname)8s] %(message)s (%(filename)s:%(lineno)s)",
             level="ERROR",
         )
 
     log.info("Loading haplotypes")
-    hp = Haplotypes(haplotypes, haplotype=Haplotype, log=log)
-    hp.read(region=region)
+    hp = Haplotypes(args.haplotypes, haplotype=Haplotype, log=log)
+    hp.read(region=args.region)
 
     log.info("Extracting variants from haplotypes")
     variants = {var.id for hap in hp.data.values() for var in hap.variants}
 
-    if genotypes.suffix == ".pgen":
+    if args.genotypes.suffix == ".pgen":
         log.info("Loading genotypes from PGEN file")
-        gt = GenotypesPLINK(genotypes, log=log, chunk_size=chunk_size)
+        gt = GenotypesPLINK(args.genotypes, log=log, chunk_size=args.chunk_size)
     else:
         log.info("Loading genotypes from VCF/BCF file")
-        gt = GenotypesRefAlt(genotypes, log=log)
+        gt = GenotypesRefAlt(args.genotypes, log=log)
     # gt._prephased = True
-    gt.read(region=region, samples=samples, variants=variants)
+    gt.read(region=args.region, samples=args.samples, variants=variants)
     log.info("QC-ing genotypes")
     gt.check_missing()
     gt.check_biallelic()
@@ -285,8 +293,8 @@ def simulate_pt(
 
     # Initialize phenotype simulator (haptools simphenotype)
     log.info("Simulating phenotypes")
-    pt_sim = PhenoSimulator(hp_gt, output=output, log=log)
-    for i in range(num_replications):
-        pt_sim.run(hp.data.values(), heritability, prevalence)
+    pt_sim = PhenoSimulator(hp_gt, output=args.output, log=log)
+    for i in range(args.num_replications):
+        pt_sim.run(hp.data.values(), args.heritability, args.prevalence)
     log.info("Writing phenotypes")
     pt_sim.write()
@@ -1,25 +1,17 @@
 from __future__ import annotations
 import logging
 from pathlib import Path
+from dataclasses import dataclass
 
 from haptools import data
 
 
-def transform_haps(
-    genotypes: Path,
-    haplotypes: Path,
-    region: str = None,
-    samples: list[str] = None,
-    haplotype_ids: set[str] = None,
-    chunk_size: int = None,
-    discard_missing: bool = False,
-    output: Path = Path("-"),
-    log: Logger = None,
-):
+@dataclass(frozen=True)
+class TransformArgs:
     """
-    Creates a VCF composed of haplotypes
+    The parameters of a run of :py:func:`~.transform_haps`
 
-    Parameters
+    Attributes
     ----------
     genotypes : Path
         The path to the genotypes
@@ -30,7 +22,7 @@ def transform_haps(
         and :py:meth:`~.data.Haplotypes.read`
     samples : list[str], optional
         See documentation for :py:meth:`~.data.Genotypes.read`
-    haplotype_ids: set[str], optional
+    haplotype_ids: frozenset[str], optional
         A set of haplotype IDs to obtain from the .hap file. All others are ignored.
 
         If not provided, all haplotypes will be used.
@@ -46,6 +38,26 @@ def transform_haps(
         The default is simply to complain about it
     output : Path, optional
         The location to which to write output
+    """
+
+    genotypes: Path
+    haplotypes: Path
+    region: str = None
+    samples: list[str] = None
+    haplotype_ids: frozenset[str] = None
+    chunk_size: int = None
+    discard_missing: bool = False
+    output: Path = Path("-")
+
+
+def transform_haps(args: TransformArgs, log: Logger = None):
+    """
+    Creates a VCF composed of haplotypes
+
+    Parameters
+    ----------
+    args : TransformArgs
+        The genotypes, haplotypes, and other parameters of the transformation
     log : Logger, optional
         A logging module to which to write messages about progress and any errors
     """
@@ -57,21 +69,21 @@ def transform_haps(
         )
 
     log.info("Loading haplotypes")
-    hp = data.Haplotypes(haplotypes, log=log)
-    hp.read(region=region, haplotypes=haplotype_ids)
+    hp = data.Haplotypes(args.haplotypes, log=log)
+    hp.read(region=args.region, haplotypes=args.haplotype_ids)
 
     log.info("Extracting variants from haplotypes")
     variants = {var.id for hap in hp.data.values() for var in hap.variants}
 
-    if genotypes.suffix == ".pgen":
+    if args.genotypes.suffix == ".pgen":
         log.info("Loading genotypes from PGEN file")
-        gt = data.GenotypesPLINK(genotypes, log=log, chunk_size=chunk_size)
+        gt = data.GenotypesPLINK(args.genotypes, log=log, chunk_size=args.chunk_size)
     else:
         log.info("Loading genotypes from VCF/BCF file")
-        gt = data.GenotypesRefAlt(genotypes, log=log)
+        gt = data.GenotypesRefAlt(args.genotypes, log=log)
     # gt._prephased = True
-    gt.read(region=region, samples=samples, variants=variants)
-    gt.check_missing(discard_also=discard_missing)
+    gt.read(region=args.region, samples=args.samples, variants=variants)
+    gt.check_missing(discard_also=args.discard_missing)
     gt.check_biallelic()
     gt.check_phase()
 
@@ -85,12 +97,14 @@ def transform_haps(
             f"file. Here are the first few missing variants: {diff[:first_few]}"
         )
 
-    if output.suffix == ".pgen":
+    if args.output.suffix == ".pgen":
         out_file_type = "PGEN"
-        hp_gt = data.GenotypesPLINK(fname=output, log=log, chunk_size=chunk_size)
+        hp_gt = data.GenotypesPLINK(
+            fname=args.output, log=log, chunk_size=args.chunk_size
+        )
     else:
         out_file_type = "VCF/BCF"
-        hp_gt = data.GenotypesRefAlt(fname=output, log=log)
+        hp_gt = data.GenotypesRefAlt(fname=args.output, log=log)
     log.info("Transforming genotypes via haplotypes")
     hp.transform(gt, hp_gt)
 
@@ -0,0 +1,100 @@
+import sys
+import subprocess
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from haptools._version import __version__
+from haptools.__main__ import main, _TOPLEVEL_HELP
+
+
+# packages that take a long time to import and should never be needed for --help
+HEAVY_MODULES = {"numpy", "pysam", "cyvcf2", "matplotlib", "pgenlib", "scipy", "pandas"}
+
+
+def test_toplevel_help():
+    """
+    The pre-rendered 'haptools --help' must match what click would have written
+    """
+    result = CliRunner().invoke(
+        main, ["--help"], prog_name="haptools", terminal_width=80
+    )
+    assert result.exit_code == 0
+    assert result.output == _TOPLEVEL_HELP
+
+
+@pytest.mark.parametrize("args", [[], ["--help"]])
+def test_list_commands_does_not_load_commands(args):
+    """
+    Listing the subcommands in the help text shouldn't import any of them
+    """
+    code = (
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from haptools.__main__ import main\n"
+        f"CliRunner().invoke(main, {args!r}, prog_name='haptools')\n"
+        "print(' '.join(sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parent.parent,
+    )
+    assert result.returncode == 0, result.stderr
+    loaded = {
+        module
+        for module in result.stdout.split()
+        if module.startswith("haptools._cli.") and module != "haptools._cli.help"
+    }
+    assert not loaded, f"subcommands loaded to list them: {loaded}"
+
+
+def test_version():
+    """
+    The version printed by 'haptools --version' must match the one in pyproject.toml
+    """
+    pyproject = Path(__file__).parent.parent.joinpath("pyproject.toml")
+    section = None
+    version = None
+    with open(pyproject) as toml_file:
+        for line in toml_file:
+            line = line.strip()
+            if line.startswith("["):
+                section = line
+            elif section == "[tool.poetry]" and line.startswith("version"):
+                version = line.split("=", 1)[1].strip().strip('"')
+                break
+    assert version == __version__
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--help"],
+        ["--version"],
+        ["karyogram", "--help"],
+        ["simgenotype", "--help"],
+        ["simphenotype", "--help"],
+        ["transform", "--help"],
+    ],
+)
+def test_help_does_not_import_heavy(args):
+    """
+    Asking for help should never import any of the heavy modules
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "haptools", *args],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parent.parent,
+    )
+    assert result.returncode == 0, result.stderr
+    imported = {
+        line.split()[-1].split(".")[0]
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    heavy = HEAVY_MODULES & imported
+    assert not heavy, f"heavy modules imported for {' '.join(args)}: {heavy}"
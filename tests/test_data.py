@@ -596,6 +596,18 @@ class TestHaplotypes:
         haps.read(region="21:26928472-26941960", haplotypes={"chr21.q.3365*1"})
         assert expected == haps.data
 
+        # the haplotype IDs can also be given as a frozenset
+        haps = Haplotypes(DATADIR.joinpath("basic.hap.gz"))
+        haps.read(haplotypes=frozenset({"chr21.q.3365*1"}))
+        assert expected == haps.data
+
+        # reading shouldn't remove anything from the caller's set of haplotype IDs
+        hap_ids = {"chr21.q.3365*1"}
+        haps = Haplotypes(DATADIR.joinpath("basic.hap.gz"))
+        haps.read(haplotypes=hap_ids)
+        assert expected == haps.data
+        assert hap_ids == {"chr21.q.3365*1"}
+
         expected = self._basic_haps()
 
         haps = Haplotypes(DATADIR.joinpath("basic.hap.gz"))